@@ -1,14 +1,36 @@
-from typing import Dict, List, Optional
+from collections import defaultdict
+from itertools import count
+from typing import Dict, Iterable, List, Optional, Set
+from sortedcontainers import SortedDict
 from app.models.string_model import StringModel
 
 class InMemoryDatabase:
     def __init__(self):
         # Store by value for easy lookup
         self._store: Dict[str, StringModel] = {}
+        # Secondary index for O(1) lookup by SHA-256 hash
+        self._by_hash: Dict[str, StringModel] = {}
+        # Inverted indexes over filterable properties (property -> set of values)
+        self._by_palindrome: Dict[bool, Set[str]] = {True: set(), False: set()}
+        self._by_length: SortedDict = SortedDict()
+        self._by_word_count: Dict[int, Set[str]] = defaultdict(set)
+        self._by_char: Dict[str, Set[str]] = defaultdict(set)
+        # Insertion order, so index lookups come back in the same order as get_all()
+        self._order: Dict[str, int] = {}
+        self._counter = count()
     
     def create(self, string_model: StringModel) -> StringModel:
         """Create a new string entry."""
-        self._store[string_model.value] = string_model
+        value = string_model.value
+        properties = string_model.properties
+        self._store[value] = string_model
+        self._by_hash[string_model.id] = string_model
+        self._order[value] = next(self._counter)
+        self._by_palindrome[properties['is_palindrome']].add(value)
+        self._by_length.setdefault(properties['length'], set()).add(value)
+        self._by_word_count[properties['word_count']].add(value)
+        for char in properties['character_frequency_map']:
+            self._by_char[char].add(value)
         return string_model
     
     def get_by_value(self, value: str) -> Optional[StringModel]:
@@ -17,10 +39,7 @@ class InMemoryDatabase:
     
     def get_by_hash(self, hash_value: str) -> Optional[StringModel]:
         """Get string by its SHA-256 hash."""
-        for string_model in self._store.values():
-            if string_model.id == hash_value:
-                return string_model
-        return None
+        return self._by_hash.get(hash_value)
     
     def exists(self, value: str) -> bool:
         """Check if string exists in database."""
@@ -30,12 +49,66 @@ class InMemoryDatabase:
         """Get all strings."""
         return list(self._store.values())
     
+    def get_many(self, values: Iterable[str]) -> List[StringModel]:
+        """Get the strings for the given values, in insertion order."""
+        store = self._store
+        models = [store[value] for value in values if value in store]
+        models.sort(key=lambda s: self._order[s.value])
+        return models
+    
+    def values_by_palindrome(self, is_palindrome: bool) -> Set[str]:
+        """Get the values whose palindrome status matches."""
+        return self._by_palindrome[bool(is_palindrome)]
+    
+    def values_by_length(self, min_length: Optional[int] = None, max_length: Optional[int] = None) -> Set[str]:
+        """Get the values whose length lies within the inclusive bounds."""
+        result = set()
+        for length in self._by_length.irange(min_length, max_length):
+            result |= self._by_length[length]
+        return result
+    
+    def values_by_word_count(self, word_count: int) -> Set[str]:
+        """Get the values with exactly the given number of words."""
+        return self._by_word_count.get(word_count, set())
+    
+    def values_with_character(self, char: str) -> Set[str]:
+        """Get the values containing the given character."""
+        return self._by_char.get(char, set())
+    
     def delete(self, value: str) -> bool:
         """Delete string by value. Returns True if deleted, False if not found."""
-        if value in self._store:
-            del self._store[value]
-            return True
-        return False
+        string_model = self._store.pop(value, None)
+        if string_model is None:
+            return False
+        properties = string_model.properties
+        self._by_hash.pop(string_model.id, None)
+        self._order.pop(value, None)
+        self._by_palindrome[properties['is_palindrome']].discard(value)
+        self._discard(self._by_length, properties['length'], value)
+        self._discard(self._by_word_count, properties['word_count'], value)
+        for char in properties['character_frequency_map']:
+            self._discard(self._by_char, char, value)
+        return True
+    
+    @staticmethod
+    def _discard(index, key, value: str) -> None:
+        """Remove value from an index bucket, dropping the bucket once empty."""
+        bucket = index.get(key)
+        if bucket is not None:
+            bucket.discard(value)
+            if not bucket:
+                del index[key]
+    
+    def clear(self) -> None:
+        """Remove all strings and their index entries."""
+        self._store.clear()
+        self._by_hash.clear()
+        self._order.clear()
+        for bucket in self._by_palindrome.values():
+            bucket.clear()
+        self._by_length.clear()
+        self._by_word_count.clear()
+        self._by_char.clear()
     
     def count(self) -> int:
         """Get total count of strings."""
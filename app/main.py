@@ -1,15 +1,19 @@
+import orjson
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+from datetime import datetime, timezone
+from fastapi.responses import Response
 from fastapi.exceptions import RequestValidationError
-from datetime import datetime
 
 from app.config import settings
 from app.routers import strings
+from app.utils.responses import ORJSONResponse
+from app.utils.timestamps import utc_now_iso
 
 app = FastAPI(
     title=settings.app_name,
     version=settings.app_version,
-    debug=settings.debug
+    debug=settings.debug,
+    default_response_class=ORJSONResponse
 )
 
 # Include routers
@@ -18,36 +22,38 @@ app.include_router(strings.router)
 # Global exception handler for validation errors
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=422,
         content={
             "error": "VALIDATION_ERROR",
             "message": "Request validation failed",
             "details": exc.errors(),
-            "timestamp": datetime.utcnow().isoformat() + "Z",
-            "path": str(request.url.path)
+            "timestamp": datetime.now(timezone.utc),
+            "path": request.scope["path"]
         }
     )
 
+# Root endpoint payload never changes, so it is serialized once at import
+_ROOT_BYTES = orjson.dumps({
+    "message": "String Analysis API",
+    "version": settings.app_version,
+    "endpoints": {
+        "create": "POST /strings",
+        "get_one": "GET /strings/{string_value}",
+        "get_all": "GET /strings",
+        "filter_nl": "GET /strings/filter-by-natural-language",
+        "delete": "DELETE /strings/{string_value}"
+    }
+})
+
 # Root endpoint
 @app.get("/")
 async def root():
-    return {
-        "message": "String Analysis API",
-        "version": settings.app_version,
-        "endpoints": {
-            "create": "POST /strings",
-            "get_one": "GET /strings/{string_value}",
-            "get_all": "GET /strings",
-            "filter_nl": "GET /strings/filter-by-natural-language",
-            "delete": "DELETE /strings/{string_value}"
-        }
-    }
+    return Response(content=_ROOT_BYTES, media_type="application/json")
 
 # Health check endpoint
 @app.get("/health")
 async def health_check():
-    return {
-        "status": "healthy",
-        "timestamp": datetime.utcnow().isoformat() + "Z"
-    }
\ No newline at end of file
+    # Only the timestamp varies, so it is spliced into a fixed JSON template
+    body = b'{"status":"healthy","timestamp":"' + utc_now_iso().encode() + b'"}'
+    return Response(content=body, media_type="application/json")
\ No newline at end of file
@@ -1,17 +1,27 @@
-from datetime import datetime
+import orjson
 from typing import Dict
+from app.utils.timestamps import utc_now_iso
 
 class StringModel:
+    # No per-instance __dict__: smaller objects and faster attribute access on list scans
+    __slots__ = ('value', 'properties', 'id', 'created_at', '_cached_dict', '_cached_json_bytes')
+    
     def __init__(self, value: str, properties: Dict, created_at: str = None):
         self.value = value
         self.properties = properties
         self.id = properties['sha256_hash']
-        self.created_at = created_at or datetime.utcnow().isoformat() + "Z"
-    
-    def to_dict(self) -> dict:
-        return {
+        self.created_at = created_at or utc_now_iso()
+        # Strings are immutable once stored, so the serialized forms are built once
+        self._cached_dict = {
             "id": self.id,
             "value": self.value,
             "properties": self.properties,
             "created_at": self.created_at
-        }
\ No newline at end of file
+        }
+        self._cached_json_bytes = orjson.dumps(self._cached_dict)
+    
+    def to_dict(self) -> dict:
+        return self._cached_dict
+    
+    def to_json_bytes(self) -> bytes:
+        return self._cached_json_bytes
\ No newline at end of file
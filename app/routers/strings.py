@@ -1,10 +1,13 @@
-from fastapi import APIRouter, HTTPException, Query, Request
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import Response
 from typing import Optional
-from datetime import datetime
 from urllib.parse import unquote
 
-from app.schemas.requests import CreateStringRequest
+from app.schemas.requests import (
+    CreateStringRequest,
+    CreateStringRequestSchema,
+    parse_create_string_request
+)
 from app.schemas.responses import (
     StringResponseSchema, 
     StringListResponseSchema,
@@ -16,12 +19,34 @@ from app.services.nl_parser import NaturalLanguageParser
 from app.models.string_model import StringModel
 from app.database import db
 from app.utils.error_response import create_error_response
+from app.utils.responses import ORJSONResponse, string_list_response
+from app.utils.validators import check_length_conflict
 router = APIRouter(prefix="/api/v1/strings", tags=["strings"])
 
 
 
-@router.post("", status_code=201, response_model=StringResponseSchema)
-async def create_string(request: Request, body: CreateStringRequest):
+@router.post(
+    "",
+    status_code=201,
+    responses={
+        201: {"model": StringResponseSchema},
+        # The body is decoded by a dependency, so FastAPI no longer adds the 422 itself
+        422: {
+            "description": "Validation Error",
+            "content": {"application/json": {"schema": {"$ref": "#/components/schemas/HTTPValidationError"}}}
+        }
+    },
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": CreateStringRequestSchema.model_json_schema()}}
+        }
+    }
+)
+async def create_string(
+    request: Request,
+    body: CreateStringRequest = Depends(parse_create_string_request)
+):
     """
     Analyze and store a new string.
 
@@ -40,15 +65,16 @@ async def create_string(request: Request, body: CreateStringRequest):
         HTTPException: Returns 409 if the string already exists, 400 if the value is empty,
                        or 422 if the data type is invalid.
     """
+    path = request.scope["path"]
     try:
-        # Check if string already exists
-        if db.exists(body.value):
-            existing = db.get_by_value(body.value)
+        # Check if string already exists (one lookup serves both the check and the details)
+        existing = db.get_by_value(body.value)
+        if existing is not None:
             return create_error_response(
                 error_type="CONFLICT",
                 message="String already exists in the system",
                 status_code=409,
-                path=str(request.url.path),
+                path=path,
                 details={
                     "existing_id": existing.id,
                     "value": body.value,
@@ -62,7 +88,7 @@ async def create_string(request: Request, body: CreateStringRequest):
                 error_type="BAD_REQUEST",
                 message="Invalid request body or missing 'value' field",
                 status_code=400,
-                path=str(request.url.path),
+                path=path,
                 details={
                     "field": "value",
                     "error": "value cannot be empty"
@@ -76,21 +102,21 @@ async def create_string(request: Request, body: CreateStringRequest):
         string_model = StringModel(value=body.value, properties=properties)
         db.create(string_model)
         
-        return string_model.to_dict()
+        return ORJSONResponse(content=string_model.to_dict(), status_code=201)
     
     except ValueError as e:
         return create_error_response(
             error_type="UNPROCESSABLE_ENTITY",
             message="Invalid data type for 'value' field",
             status_code=422,
-            path=str(request.url.path),
+            path=path,
             details={
                 "field": "value",
                 "error": str(e)
             }
         )
 
-@router.get("", response_model=StringListResponseSchema)
+@router.get("", responses={200: {"model": StringListResponseSchema}})
 async def get_all_strings(
     request: Request,
     is_palindrome: Optional[bool] = Query(None),
@@ -119,6 +145,7 @@ async def get_all_strings(
     Raises:
         HTTPException: Returns 400 if filter combinations are invalid.
     """
+    path = request.scope["path"]
     # Build filters dictionary
     filters = {}
     if is_palindrome is not None:
@@ -132,28 +159,23 @@ async def get_all_strings(
     if contains_character is not None:
         filters['contains_character'] = contains_character
     
-    # Validate filter conflicts
-    is_valid, error_msg = FilterService.validate_filter_conflicts(filters)
+    # Validate filter conflicts straight from the parsed bounds
+    is_valid, error_msg = check_length_conflict(min_length, max_length)
     if not is_valid:
         return create_error_response(
             error_type="BAD_REQUEST",
             message="Invalid filter combination",
             status_code=400,
-            path=str(request.url.path),
+            path=path,
             details={"conflict": error_msg, "filters": filters}
         )
     
-    # Get all strings and apply filters
-    all_strings = db.get_all()
-    filtered_strings = FilterService.apply_filters(all_strings, filters)
+    # Apply filters against the database indexes
+    filtered_strings = FilterService.apply_indexed_filters(db, filters)
     
-    return {
-        "data": [s.to_dict() for s in filtered_strings],
-        "count": len(filtered_strings),
-        "filters_applied": filters
-    }
+    return string_list_response(filtered_strings, filters_applied=filters)
 
-@router.get("/filter-by-natural-language", response_model=NaturalLanguageResponseSchema)
+@router.get("/filter-by-natural-language", responses={200: {"model": NaturalLanguageResponseSchema}})
 async def filter_by_natural_language(
     request: Request,
     query: str = Query(..., min_length=1)
@@ -175,18 +197,18 @@ async def filter_by_natural_language(
     Raises:
         HTTPException: Returns 400 if the query cannot be parsed, or 422 if parsed filters conflict.
     """
-    # Parse the natural language query
-    if not NaturalLanguageParser.can_parse(query):
+    path = request.scope["path"]
+    # Parse the natural language query (memoized per raw query by the parser)
+    parsed_filters = NaturalLanguageParser.try_parse(query)
+    if parsed_filters is None:
         return create_error_response(
             error_type="BAD_REQUEST",
             message="Unable to parse natural language query",
             status_code=400,
-            path=str(request.url.path),
+            path=path,
             details={"query": query}
         )
     
-    parsed_filters = NaturalLanguageParser.parse_query(query)
-    
     # Validate filter conflicts
     is_valid, error_msg = FilterService.validate_filter_conflicts(parsed_filters)
     if not is_valid:
@@ -194,7 +216,7 @@ async def filter_by_natural_language(
             error_type="UNPROCESSABLE_ENTITY",
             message="Query parsed but resulted in conflicting filters",
             status_code=422,
-            path=str(request.url.path),
+            path=path,
             details={
                 "conflict": error_msg,
                 "filters": parsed_filters
@@ -202,19 +224,17 @@ async def filter_by_natural_language(
         )
     
     # Apply filters
-    all_strings = db.get_all()
-    filtered_strings = FilterService.apply_filters(all_strings, parsed_filters)
+    filtered_strings = FilterService.apply_indexed_filters(db, parsed_filters)
     
-    return {
-        "data": [s.to_dict() for s in filtered_strings],
-        "count": len(filtered_strings),
-        "interpreted_query": {
+    return string_list_response(
+        filtered_strings,
+        interpreted_query={
             "original": query,
             "parsed_filters": parsed_filters
         }
-    }
+    )
 
-@router.get("/{string_value}", response_model=StringResponseSchema)
+@router.get("/{string_value}", responses={200: {"model": StringResponseSchema}})
 async def get_string(request: Request, string_value: str):
     """
     Retrieve a specific string by its value.
@@ -232,6 +252,7 @@ async def get_string(request: Request, string_value: str):
     Raises:
         HTTPException: Returns 404 if the string does not exist in the system.
     """
+    path = request.scope["path"]
     # Decode URL-encoded string
     decoded_value = unquote(string_value)
     
@@ -242,11 +263,11 @@ async def get_string(request: Request, string_value: str):
             error_type="NOT_FOUND",
             message="String does not exist in the system",
             status_code=404,
-            path=str(request.url.path),
+            path=path,
             details={"requested_value": decoded_value}
         )
     
-    return string_model.to_dict()
+    return ORJSONResponse(content=string_model.to_dict())
 
 @router.delete("/{string_value}", status_code=204)
 async def delete_string(request: Request, string_value: str):
@@ -266,6 +287,7 @@ async def delete_string(request: Request, string_value: str):
     Raises:
         HTTPException: Returns 404 if the string does not exist in the system.
     """
+    path = request.scope["path"]
     # Decode URL-encoded string
     decoded_value = unquote(string_value)
     
@@ -276,8 +298,8 @@ async def delete_string(request: Request, string_value: str):
             error_type="NOT_FOUND",
             message="String does not exist in the system",
             status_code=404,
-            path=str(request.url.path),
+            path=path,
             details={"requested_value": decoded_value}
         )
     
-    return JSONResponse(status_code=204, content=None)
\ No newline at end of file
+    return Response(status_code=204)
\ No newline at end of file
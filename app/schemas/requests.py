@@ -1,15 +1,57 @@
-from pydantic import BaseModel, Field, field_validator
+import msgspec
+from fastapi import HTTPException, Request
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError, field_validator
 from typing import Optional
 
-class CreateStringRequest(BaseModel):
+class CreateStringRequest(msgspec.Struct):
+    value: str
+
+# Pydantic mirror of CreateStringRequest, used only for the OpenAPI schema
+class CreateStringRequestSchema(BaseModel):
     value: str = Field(..., description="String to analyze")
+
+# Reusable decoder keeps the compiled type info instead of rebuilding it per request
+_create_string_decoder = msgspec.json.Decoder(CreateStringRequest)
+# Slow path for rejected bodies, so their errors come from pydantic as they would in FastAPI
+_create_string_adapter = TypeAdapter(CreateStringRequestSchema)
+
+def _is_json_content_type(content_type: str) -> bool:
+    """Match FastAPI's rule: application/json or any application/*+json media type."""
+    media_type = content_type.split(';', 1)[0].strip().lower()
+    return media_type == 'application/json' or (
+        media_type.startswith('application/') and media_type.endswith('+json')
+    )
+
+def _validation_error(error: ValidationError) -> RequestValidationError:
+    """Re-root pydantic errors under "body", as FastAPI reports body validation errors."""
+    return RequestValidationError([{**e, "loc": ("body", *e["loc"])} for e in error.errors()])
+
+async def parse_create_string_request(request: Request) -> CreateStringRequest:
+    """Decode a CreateStringRequest body with msgspec, bypassing pydantic validation."""
+    body = await request.body()
     
-    @field_validator('value')
-    @classmethod
-    def validate_value(cls, v):
-        if not isinstance(v, str):
-            raise ValueError('value must be a string')
-        return v
+    # Like FastAPI, bodies sent with a non-JSON content type are not parsed as JSON
+    content_type = request.headers.get('content-type')
+    if content_type is not None and not _is_json_content_type(content_type):
+        try:
+            _create_string_adapter.validate_python(body)
+        except ValidationError as e:
+            raise _validation_error(e)
+    
+    try:
+        return _create_string_decoder.decode(body)
+    except msgspec.DecodeError:
+        pass
+    except ValueError:
+        # Not valid UTF-8; FastAPI answers undecodable bodies with this 400
+        raise HTTPException(status_code=400, detail="There was an error parsing the body")
+    
+    try:
+        validated = _create_string_adapter.validate_json(body)
+    except ValidationError as e:
+        raise _validation_error(e)
+    return CreateStringRequest(value=validated.value)
 
 class QueryFiltersRequest(BaseModel):
     is_palindrome: Optional[bool] = None
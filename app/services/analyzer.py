@@ -1,6 +1,17 @@
 import hashlib
+import numpy as np
+from collections import Counter
 from typing import Dict
 
+# Below this length str.split() is faster than the vectorized word count
+_VECTORIZED_WORD_COUNT_MIN_LENGTH = 4096
+
+# Below this length Counter is faster than the vectorized histogram
+_VECTORIZED_FREQUENCY_MIN_LENGTH = 512
+
+# ASCII byte -> is whitespace, using the same definition as str.split()
+_ASCII_WHITESPACE = np.array([chr(code).isspace() for code in range(128)], dtype=bool)
+
 class StringAnalyzer:
     @staticmethod
     def calculate_length(value: str) -> int:
@@ -10,6 +21,11 @@ class StringAnalyzer:
     @staticmethod
     def check_palindrome(value: str) -> bool:
         """Check if string is a palindrome (case-insensitive)."""
+        # Long ASCII strings usually differ at the ends; reject those before copying.
+        # (Non-ASCII is excluded because some characters lower to several code points.)
+        if len(value) > 64 and value.isascii() and value[0].lower() != value[-1].lower():
+            return False
+        
         cleaned = value.lower()
         return cleaned == cleaned[::-1]
     
@@ -21,29 +37,42 @@ class StringAnalyzer:
     @staticmethod
     def count_words(value: str) -> int:
         """Count words separated by whitespace."""
-        return len(value.split())
+        if len(value) < _VECTORIZED_WORD_COUNT_MIN_LENGTH or not value.isascii():
+            return len(value.split())
+        
+        # Count whitespace -> non-whitespace transitions without materializing the words
+        is_space = _ASCII_WHITESPACE[np.frombuffer(value.encode('ascii'), dtype=np.uint8)]
+        starts = np.count_nonzero(is_space[:-1] & ~is_space[1:])
+        return int(starts) + (0 if is_space[0] else 1)
     
     @staticmethod
     def generate_sha256(value: str) -> str:
         """Generate SHA-256 hash of the string."""
-        return hashlib.sha256(value.encode('utf-8')).hexdigest()
+        # The hash is an identifier, not a security primitive; this keeps it on
+        # OpenSSL's fast path (SHA-NI where available) even under FIPS policies
+        return hashlib.sha256(value.encode('utf-8'), usedforsecurity=False).hexdigest()
     
     @staticmethod
     def build_char_frequency_map(value: str) -> Dict[str, int]:
         """Build a frequency map of each character."""
-        freq_map = {}
-        for char in value:
-            freq_map[char] = freq_map.get(char, 0) + 1
-        return freq_map
+        if len(value) < _VECTORIZED_FREQUENCY_MIN_LENGTH or not value.isascii():
+            return dict(Counter(value))
+        
+        counts = np.bincount(np.frombuffer(value.encode('ascii'), dtype=np.uint8), minlength=128).tolist()
+        # Emit keys in first-occurrence order, as Counter does
+        chars = sorted((chr(code) for code, count in enumerate(counts) if count), key=value.find)
+        return {char: counts[ord(char)] for char in chars}
     
     @classmethod
     def analyze(cls, value: str) -> Dict:
         """Analyze string and return all computed properties."""
+        # One counting pass serves both the frequency map and the distinct-character count
+        freq_map = cls.build_char_frequency_map(value)
         return {
-            "length": cls.calculate_length(value),
+            "length": len(value),
             "is_palindrome": cls.check_palindrome(value),
-            "unique_characters": cls.count_unique_chars(value),
+            "unique_characters": len(freq_map),
             "word_count": cls.count_words(value),
             "sha256_hash": cls.generate_sha256(value),
-            "character_frequency_map": cls.build_char_frequency_map(value)
+            "character_frequency_map": freq_map
         }
\ No newline at end of file
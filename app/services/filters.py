@@ -1,43 +1,71 @@
+import sys
 from typing import List, Dict, Any
 from app.models.string_model import StringModel
+from app.database import InMemoryDatabase
+from app.utils.validators import check_length_conflict
 
 class FilterService:
     @staticmethod
     def apply_filters(strings: List[StringModel], filters: Dict[str, Any]) -> List[StringModel]:
-        """Apply filters to list of strings."""
-        result = strings
+        """Apply filters to list of strings in a single pass."""
+        is_palindrome = filters.get('is_palindrome')
+        min_length = filters.get('min_length')
+        max_length = filters.get('max_length')
+        word_count = filters.get('word_count')
+        char = filters.get('contains_character')
         
-        # Filter by palindrome
-        if filters.get('is_palindrome') is not None:
-            result = [s for s in result if s.properties['is_palindrome'] == filters['is_palindrome']]
+        if is_palindrome is None and min_length is None and max_length is None \
+                and word_count is None and char is None:
+            return strings
+        
+        # Resolve open length bounds once so the loop compares plain ints
+        if min_length is None:
+            min_length = 0
+        if max_length is None:
+            max_length = sys.maxsize
+        
+        result = []
+        for s in strings:
+            properties = s.properties
+            if is_palindrome is not None and properties['is_palindrome'] != is_palindrome:
+                continue
+            if not min_length <= properties['length'] <= max_length:
+                continue
+            if word_count is not None and properties['word_count'] != word_count:
+                continue
+            if char is not None and char not in s.value:
+                continue
+            result.append(s)
+        
+        return result
+    
+    @staticmethod
+    def apply_indexed_filters(database: InMemoryDatabase, filters: Dict[str, Any]) -> List[StringModel]:
+        """Apply filters using the database's inverted indexes instead of a full scan."""
+        candidates = []
         
-        # Filter by min_length
-        if filters.get('min_length') is not None:
-            result = [s for s in result if s.properties['length'] >= filters['min_length']]
+        if filters.get('is_palindrome') is not None:
+            candidates.append(database.values_by_palindrome(filters['is_palindrome']))
         
-        # Filter by max_length
-        if filters.get('max_length') is not None:
-            result = [s for s in result if s.properties['length'] <= filters['max_length']]
+        if filters.get('min_length') is not None or filters.get('max_length') is not None:
+            candidates.append(database.values_by_length(filters.get('min_length'), filters.get('max_length')))
         
-        # Filter by word_count
         if filters.get('word_count') is not None:
-            result = [s for s in result if s.properties['word_count'] == filters['word_count']]
+            candidates.append(database.values_by_word_count(filters['word_count']))
         
-        # Filter by contains_character
         if filters.get('contains_character') is not None:
-            char = filters['contains_character']
-            result = [s for s in result if char in s.value]
+            candidates.append(database.values_with_character(filters['contains_character']))
         
-        return result
+        if not candidates:
+            return database.get_all()
+        
+        # Intersect starting from the smallest bucket
+        candidates.sort(key=len)
+        matched = candidates[0].intersection(*candidates[1:])
+        return database.get_many(matched)
     
     @staticmethod
     def validate_filter_conflicts(filters: Dict[str, Any]) -> tuple[bool, str]:
         """Check for conflicting filters. Returns (is_valid, error_message)."""
-        min_len = filters.get('min_length')
-        max_len = filters.get('max_length')
-        
-        if min_len is not None and max_len is not None:
-            if min_len > max_len:
-                return False, f"min_length ({min_len}) is greater than max_length ({max_len})"
-        
-        return True, ""
\ No newline at end of file
+        is_valid, error = check_length_conflict(filters.get('min_length'), filters.get('max_length'))
+        return is_valid, error or ""
\ No newline at end of file
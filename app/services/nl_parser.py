@@ -1,62 +1,91 @@
 import re
-from typing import Dict, Any
+from functools import lru_cache
+from typing import Dict, Any, Optional, Tuple
+
+_WORD_COUNT_RE = re.compile(r'(\d+)\s+words?')
+_LONGER_RE = re.compile(r'longer than (\d+)')
+_SHORTER_RE = re.compile(r'shorter than (\d+)')
+_AT_LEAST_RE = re.compile(r'at least (\d+)')
+_CONTAINS_LETTER_RE = re.compile(r'contain(?:ing|s)?\s+(?:the\s+)?(?:letter\s+)?([a-z])\b')
+_LETTER_RE = re.compile(r'letter ([a-z])')
+# Largest parsed number that still serializes as a JSON integer with orjson
+_MAX_PARSED_INT = 2**63 - 1
+
+@lru_cache(maxsize=1024)
+def _parse_query_cached(query: str) -> Tuple[Tuple[str, Any], ...]:
+    """Parse a query into filter items; memoized since the same phrasings repeat."""
+    query_lower = query.lower()
+    filters = {}
+    
+    # Palindrome detection
+    if 'palindrome' in query_lower or 'palindromic' in query_lower:
+        filters['is_palindrome'] = True
+    
+    # Single word detection
+    if 'single word' in query_lower or 'one word' in query_lower:
+        filters['word_count'] = 1
+    
+    # Word count detection (exact numbers)
+    word_count_match = _WORD_COUNT_RE.search(query_lower)
+    if word_count_match and 'word_count' not in filters:
+        filters['word_count'] = int(word_count_match.group(1))
+    
+    # Length constraints - "longer than X"
+    longer_match = _LONGER_RE.search(query_lower)
+    if longer_match:
+        filters['min_length'] = int(longer_match.group(1)) + 1
+    
+    # Length constraints - "shorter than X"
+    shorter_match = _SHORTER_RE.search(query_lower)
+    if shorter_match:
+        filters['max_length'] = int(shorter_match.group(1)) - 1
+    
+    # Length constraints - "at least X characters"
+    at_least_match = _AT_LEAST_RE.search(query_lower)
+    if at_least_match:
+        filters['min_length'] = int(at_least_match.group(1))
+    
+    # Contains specific letter
+    contains_letter_match = _CONTAINS_LETTER_RE.search(query_lower)
+    if contains_letter_match:
+        filters['contains_character'] = contains_letter_match.group(1)
+    
+    # First vowel heuristic
+    if 'first vowel' in query_lower:
+        filters['contains_character'] = 'a'
+    
+    # Specific character patterns
+    letter_z_match = _LETTER_RE.search(query_lower)
+    if letter_z_match and 'contains_character' not in filters:
+        filters['contains_character'] = letter_z_match.group(1)
+    
+    # Numbers beyond 64 bits cannot be real lengths or counts; treat the query as unparseable
+    if any(filters.get(key, 0) > _MAX_PARSED_INT for key in ('word_count', 'min_length', 'max_length')):
+        return ()
+    
+    return tuple(filters.items())
+
 
 class NaturalLanguageParser:
     @staticmethod
     def parse_query(query: str) -> Dict[str, Any]:
         """Parse natural language query into structured filters."""
-        query_lower = query.lower()
-        filters = {}
-        
-        # Palindrome detection
-        if 'palindrome' in query_lower or 'palindromic' in query_lower:
-            filters['is_palindrome'] = True
-        
-        # Single word detection
-        if 'single word' in query_lower or 'one word' in query_lower:
-            filters['word_count'] = 1
-        
-        # Word count detection (exact numbers)
-        word_count_match = re.search(r'(\d+)\s+words?', query_lower)
-        if word_count_match and 'word_count' not in filters:
-            filters['word_count'] = int(word_count_match.group(1))
-        
-        # Length constraints - "longer than X"
-        longer_match = re.search(r'longer than (\d+)', query_lower)
-        if longer_match:
-            filters['min_length'] = int(longer_match.group(1)) + 1
-        
-        # Length constraints - "shorter than X"
-        shorter_match = re.search(r'shorter than (\d+)', query_lower)
-        if shorter_match:
-            filters['max_length'] = int(shorter_match.group(1)) - 1
-        
-        # Length constraints - "at least X characters"
-        at_least_match = re.search(r'at least (\d+)', query_lower)
-        if at_least_match:
-            filters['min_length'] = int(at_least_match.group(1))
-        
-        # Contains specific letter
-        contains_letter_match = re.search(r'contain(?:ing|s)?\s+(?:the\s+)?(?:letter\s+)?([a-z])\b', query_lower)
-        if contains_letter_match:
-            filters['contains_character'] = contains_letter_match.group(1)
-        
-        # First vowel heuristic
-        if 'first vowel' in query_lower:
-            filters['contains_character'] = 'a'
-        
-        # Specific character patterns
-        letter_z_match = re.search(r'letter ([a-z])', query_lower)
-        if letter_z_match and 'contains_character' not in filters:
-            filters['contains_character'] = letter_z_match.group(1)
-        
-        return filters
+        return dict(_parse_query_cached(query))
+    
+    @staticmethod
+    def try_parse(query: str) -> Optional[Dict[str, Any]]:
+        """Parse query into filters, or return None if it yields no usable filters."""
+        try:
+            items = _parse_query_cached(query)
+        except Exception:
+            return None
+        return dict(items) if items else None
     
     @staticmethod
     def can_parse(query: str) -> bool:
-        """Check if query can be parsed into valid filters."""
+        """Check if query can be parsed into valid filters (prefer try_parse to also get them)."""
         try:
-            filters = NaturalLanguageParser.parse_query(query)
-            return len(filters) > 0
+            # Check the memoized items directly rather than copying them into a dict
+            return len(_parse_query_cached(query)) > 0
         except Exception:
             return False
\ No newline at end of file
@@ -1,5 +1,5 @@
-from fastapi.responses import JSONResponse
-from datetime import datetime
+from datetime import datetime, timezone
+from app.utils.responses import ORJSONResponse
 
 def create_error_response(error_type: str, message: str, status_code: int, path: str, details=None):
     """
@@ -13,15 +13,16 @@ def create_error_response(error_type: str, message: str, status_code: int, path:
         details (dict, optional): Additional error details.
 
     Returns:
-        JSONResponse: A FastAPI JSONResponse object with the error details.
+        ORJSONResponse: A response object with the error details; the timestamp is
+                        formatted by orjson during serialization.
     """
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status_code,
         content={
             "error": error_type,
             "message": message,
             "details": details,
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": datetime.now(timezone.utc),
             "path": path
         }
     )
@@ -0,0 +1,63 @@
+import json
+import orjson
+from datetime import datetime
+from typing import Any, Sequence
+from fastapi.responses import JSONResponse, Response
+
+# datetime values are formatted by orjson itself as UTC ISO 8601 with a trailing "Z"
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+
+
+def _json_default(obj: Any) -> Any:
+    """Format values the stdlib json module cannot, the way orjson does."""
+    if isinstance(obj, datetime):
+        if obj.tzinfo is None:
+            return obj.isoformat() + "Z"
+        return obj.isoformat().replace("+00:00", "Z")
+    return str(obj)
+
+
+def dumps_json(content: Any) -> bytes:
+    """
+    Serialize content to JSON bytes with orjson.
+
+    orjson rejects integers wider than 64 bits (e.g. an oversized query
+    parameter echoed back in filters_applied), so those payloads fall back
+    to the stdlib json module.
+
+    Returns:
+        bytes: The encoded JSON document.
+    """
+    try:
+        return orjson.dumps(content, default=str, option=_ORJSON_OPTIONS)
+    except TypeError:
+        return json.dumps(
+            content, default=_json_default, ensure_ascii=False, allow_nan=False, separators=(",", ":")
+        ).encode("utf-8")
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson instead of the stdlib json module."""
+
+    def render(self, content) -> bytes:
+        return dumps_json(content)
+
+
+def string_list_response(strings: Sequence[Any], **fields: Any) -> Response:
+    """
+    Build a list response by splicing each string's pre-serialized JSON.
+
+    Args:
+        strings: Items exposing to_json_bytes(), emitted under "data".
+        **fields: Extra top-level fields serialized after "data" and "count".
+
+    Returns:
+        Response: JSON response of the form {"data": [...], "count": N, **fields}.
+    """
+    body = b'{"data":[' + b",".join([s.to_json_bytes() for s in strings]) + b'],"count":' + str(len(strings)).encode()
+    if fields:
+        # orjson output starts with "{"; drop it so the fields continue the outer object
+        body += b"," + dumps_json(fields)[1:]
+    else:
+        body += b"}"
+    return Response(content=body, media_type="application/json")
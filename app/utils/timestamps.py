@@ -0,0 +1,22 @@
+import time
+
+# (second, "YYYY-MM-DDTHH:MM:SS") for the last second formatted
+_second_cache = [-1, ""]
+
+
+def utc_now_iso() -> str:
+    """
+    Return the current UTC time as an ISO 8601 string with a trailing "Z".
+
+    The date-time part is formatted at most once per second; only the
+    microseconds are filled in per call.
+
+    Returns:
+        str: Timestamp such as "2024-01-01T12:00:00.123456Z".
+    """
+    # Integer nanoseconds, so the microsecond part never suffers float rounding
+    second, microsecond = divmod(time.time_ns() // 1000, 1_000_000)
+    if second != _second_cache[0]:
+        _second_cache[1] = "%04d-%02d-%02dT%02d:%02d:%02d" % time.gmtime(second)[:6]
+        _second_cache[0] = second
+    return "%s.%06dZ" % (_second_cache[1], microsecond)
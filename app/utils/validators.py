@@ -1,208 +1,246 @@
 from typing import Any, Dict, Optional, Tuple
+from app.services.analyzer import StringAnalyzer
 
-class RequestValidator:
-    """Utility class for validating request data."""
+# RFC 3986 unreserved bytes; every other byte is percent-encoded
+_URL_SAFE_BYTES = b'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_.-~'
+_URL_ESCAPE_TABLE = tuple(
+    chr(byte) if byte in _URL_SAFE_BYTES else '%%%02X' % byte for byte in range(256)
+)
+
+
+# Request data validation
+
+def validate_string_value(value: Any) -> Tuple[bool, Optional[str]]:
+    """
+    Validate that the value is a string.
     
-    @staticmethod
-    def validate_string_value(value: Any) -> Tuple[bool, Optional[str]]:
-        """
-        Validate that the value is a string.
-        
-        Returns:
-            Tuple of (is_valid, error_message)
-        """
-        if not isinstance(value, str):
-            return False, f"value must be a string, received {type(value).__name__}"
-        return True, None
+    Returns:
+        Tuple of (is_valid, error_message)
+    """
+    if not isinstance(value, str):
+        return False, f"value must be a string, received {type(value).__name__}"
+    return True, None
+
+
+def validate_non_empty_string(value: str) -> Tuple[bool, Optional[str]]:
+    """
+    Validate that the string is not empty.
     
-    @staticmethod
-    def validate_non_empty_string(value: str) -> Tuple[bool, Optional[str]]:
-        """
-        Validate that the string is not empty.
-        
-        Returns:
-            Tuple of (is_valid, error_message)
-        """
-        if not value or len(value) == 0:
-            return False, "value cannot be empty"
-        return True, None
+    Returns:
+        Tuple of (is_valid, error_message)
+    """
+    if not value or len(value) == 0:
+        return False, "value cannot be empty"
+    return True, None
+
+
+def validate_query_params(params: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
+    """
+    Validate query parameters for filtering.
     
-    @staticmethod
-    def validate_query_params(params: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
-        """
-        Validate query parameters for filtering.
-        
-        Returns:
-            Tuple of (is_valid, error_message)
-        """
-        # Validate is_palindrome
-        if 'is_palindrome' in params and params['is_palindrome'] is not None:
-            if not isinstance(params['is_palindrome'], bool):
-                return False, "is_palindrome must be a boolean"
-        
-        # Validate min_length
-        if 'min_length' in params and params['min_length'] is not None:
-            if not isinstance(params['min_length'], int) or params['min_length'] < 0:
-                return False, "min_length must be a non-negative integer"
-        
-        # Validate max_length
-        if 'max_length' in params and params['max_length'] is not None:
-            if not isinstance(params['max_length'], int) or params['max_length'] < 0:
-                return False, "max_length must be a non-negative integer"
-        
-        # Validate word_count
-        if 'word_count' in params and params['word_count'] is not None:
-            if not isinstance(params['word_count'], int) or params['word_count'] < 0:
-                return False, "word_count must be a non-negative integer"
-        
-        # Validate contains_character
-        if 'contains_character' in params and params['contains_character'] is not None:
-            char = params['contains_character']
-            if not isinstance(char, str):
-                return False, "contains_character must be a string"
-            if len(char) != 1:
-                return False, "contains_character must be exactly one character"
-        
+    Returns:
+        Tuple of (is_valid, error_message)
+    """
+    if not params:
         return True, None
     
-    @staticmethod
-    def validate_natural_language_query(query: str) -> Tuple[bool, Optional[str]]:
-        """
-        Validate natural language query.
-        
-        Returns:
-            Tuple of (is_valid, error_message)
-        """
-        if not query or not query.strip():
-            return False, "query cannot be empty"
-        
-        if len(query) > 500:
-            return False, "query is too long (max 500 characters)"
-        
-        return True, None
+    # One lookup per key instead of a membership test plus an index
+    get = params.get
     
-    @staticmethod
-    def sanitize_string_for_url(value: str) -> str:
-        """
-        Sanitize string for use in URL path.
-        
-        Args:
-            value: String to sanitize
-            
-        Returns:
-            URL-safe string
-        """
-        from urllib.parse import quote
-        return quote(value, safe='')
+    # Validate is_palindrome
+    is_palindrome = get('is_palindrome')
+    if is_palindrome is not None and not isinstance(is_palindrome, bool):
+        return False, "is_palindrome must be a boolean"
+    
+    # Validate min_length
+    min_length = get('min_length')
+    if min_length is not None and (not isinstance(min_length, int) or min_length < 0):
+        return False, "min_length must be a non-negative integer"
+    
+    # Validate max_length
+    max_length = get('max_length')
+    if max_length is not None and (not isinstance(max_length, int) or max_length < 0):
+        return False, "max_length must be a non-negative integer"
+    
+    # Validate word_count
+    word_count = get('word_count')
+    if word_count is not None and (not isinstance(word_count, int) or word_count < 0):
+        return False, "word_count must be a non-negative integer"
+    
+    # Validate contains_character
+    char = get('contains_character')
+    if char is not None:
+        if not isinstance(char, str):
+            return False, "contains_character must be a string"
+        if len(char) != 1:
+            return False, "contains_character must be exactly one character"
+    
+    return True, None
 
 
-class FilterValidator:
-    """Utility class for validating filter combinations."""
+def validate_natural_language_query(query: str) -> Tuple[bool, Optional[str]]:
+    """
+    Validate natural language query.
     
-    @staticmethod
-    def check_length_conflict(min_length: Optional[int], max_length: Optional[int]) -> Tuple[bool, Optional[str]]:
-        """
-        Check if min_length and max_length create a conflict.
-        
-        Returns:
-            Tuple of (is_valid, error_message)
-        """
-        if min_length is not None and max_length is not None:
-            if min_length > max_length:
-                return False, f"min_length ({min_length}) is greater than max_length ({max_length})"
-        return True, None
+    Returns:
+        Tuple of (is_valid, error_message)
+    """
+    if not query or not query.strip():
+        return False, "query cannot be empty"
     
-    @staticmethod
-    def validate_filter_combination(filters: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
-        """
-        Validate that filter combination is valid.
-        
-        Returns:
-            Tuple of (is_valid, error_message)
-        """
-        # Check length conflict
-        min_len = filters.get('min_length')
-        max_len = filters.get('max_length')
-        
-        is_valid, error = FilterValidator.check_length_conflict(min_len, max_len)
-        if not is_valid:
-            return False, error
-        
-        # Add more validation rules here as needed
-        
-        return True, None
+    if len(query) > 500:
+        return False, "query is too long (max 500 characters)"
+    
+    return True, None
 
 
-class StringValidator:
-    """Utility class for validating string properties."""
+def sanitize_string_for_url(value: str) -> str:
+    """
+    Sanitize string for use in URL path.
     
-    @staticmethod
-    def is_valid_length(value: str, min_length: Optional[int] = None, max_length: Optional[int] = None) -> bool:
-        """Check if string length is within specified bounds."""
-        length = len(value)
-        
-        if min_length is not None and length < min_length:
-            return False
-        
-        if max_length is not None and length > max_length:
-            return False
-        
-        return True
+    Args:
+        value: String to sanitize
+        
+    Returns:
+        URL-safe string
+    """
+    encoded = value.encode('utf-8')
+    if not encoded.rstrip(_URL_SAFE_BYTES):
+        return value
+    # Same output as urllib.parse.quote(value, safe=''), via a precomputed byte table
+    table = _URL_ESCAPE_TABLE
+    return ''.join([table[byte] for byte in encoded])
+
+
+# Filter combination validation
+
+def check_length_conflict(min_length: Optional[int], max_length: Optional[int]) -> Tuple[bool, Optional[str]]:
+    """
+    Check if min_length and max_length create a conflict.
+    
+    Returns:
+        Tuple of (is_valid, error_message)
+    """
+    if min_length is not None and max_length is not None and min_length > max_length:
+        return False, f"min_length ({min_length}) is greater than max_length ({max_length})"
+    return True, None
+
+
+def validate_filter_combination(filters: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
+    """
+    Validate that filter combination is valid.
+    
+    Returns:
+        Tuple of (is_valid, error_message)
+    """
+    # Check length conflict
+    min_len = filters.get('min_length')
+    max_len = filters.get('max_length')
+    
+    is_valid, error = check_length_conflict(min_len, max_len)
+    if not is_valid:
+        return False, error
+    
+    # Add more validation rules here as needed
+    
+    return True, None
+
+
+# String property validation
+
+def is_valid_length(value: str, min_length: Optional[int] = None, max_length: Optional[int] = None) -> bool:
+    """Check if string length is within specified bounds."""
+    length = len(value)
+    return (min_length is None or length >= min_length) and (max_length is None or length <= max_length)
+
+
+def contains_character(value: str, character: str) -> bool:
+    """Check if string contains a specific character."""
+    return character in value
+
+
+def matches_word_count(value: str, word_count: int) -> bool:
+    """Check if string has exact word count."""
+    return len(value.split()) == word_count
+
+
+def is_palindrome(value: str) -> bool:
+    """Check if string is a palindrome (case-insensitive)."""
+    return StringAnalyzer.check_palindrome(value)
+
+
+# Error detail builders
+
+def build_validation_error(field: str, expected_type: str, received_type: str, received_value: Any = None) -> Dict[str, Any]:
+    """Build validation error details."""
+    details = {
+        "field": field,
+        "expected_type": expected_type,
+        "received_type": received_type
+    }
+    
+    if received_value is not None:
+        details["received_value"] = received_value
     
-    @staticmethod
-    def contains_character(value: str, character: str) -> bool:
-        """Check if string contains a specific character."""
-        return character in value
+    return details
+
+
+def build_conflict_error(existing_id: str, value: str, created_at: str) -> Dict[str, Any]:
+    """Build conflict error details."""
+    return {
+        "existing_id": existing_id,
+        "value": value,
+        "created_at": created_at
+    }
+
+
+def build_not_found_error(requested_value: str) -> Dict[str, Any]:
+    """Build not found error details."""
+    return {
+        "requested_value": requested_value
+    }
+
+
+def build_filter_conflict_error(conflict: str, filters: Dict[str, Any]) -> Dict[str, Any]:
+    """Build filter conflict error details."""
+    return {
+        "conflict": conflict,
+        "filters": filters
+    }
+
+
+# Stateless classes kept as namespaces over the functions above, for existing callers
+
+class RequestValidator:
+    """Utility class for validating request data."""
     
-    @staticmethod
-    def matches_word_count(value: str, word_count: int) -> bool:
-        """Check if string has exact word count."""
-        return len(value.split()) == word_count
+    validate_string_value = staticmethod(validate_string_value)
+    validate_non_empty_string = staticmethod(validate_non_empty_string)
+    validate_query_params = staticmethod(validate_query_params)
+    validate_natural_language_query = staticmethod(validate_natural_language_query)
+    sanitize_string_for_url = staticmethod(sanitize_string_for_url)
+
+
+class FilterValidator:
+    """Utility class for validating filter combinations."""
     
-    @staticmethod
-    def is_palindrome(value: str) -> bool:
-        """Check if string is a palindrome (case-insensitive)."""
-        cleaned = value.lower()
-        return cleaned == cleaned[::-1]
+    check_length_conflict = staticmethod(check_length_conflict)
+    validate_filter_combination = staticmethod(validate_filter_combination)
+
+
+class StringValidator:
+    """Utility class for validating string properties."""
+    
+    is_valid_length = staticmethod(is_valid_length)
+    contains_character = staticmethod(contains_character)
+    matches_word_count = staticmethod(matches_word_count)
+    is_palindrome = staticmethod(is_palindrome)
 
 
 class ErrorMessageBuilder:
     """Utility class for building consistent error messages."""
     
-    @staticmethod
-    def build_validation_error(field: str, expected_type: str, received_type: str, received_value: Any = None) -> Dict[str, Any]:
-        """Build validation error details."""
-        details = {
-            "field": field,
-            "expected_type": expected_type,
-            "received_type": received_type
-        }
-        
-        if received_value is not None:
-            details["received_value"] = received_value
-        
-        return details
-    
-    @staticmethod
-    def build_conflict_error(existing_id: str, value: str, created_at: str) -> Dict[str, Any]:
-        """Build conflict error details."""
-        return {
-            "existing_id": existing_id,
-            "value": value,
-            "created_at": created_at
-        }
-    
-    @staticmethod
-    def build_not_found_error(requested_value: str) -> Dict[str, Any]:
-        """Build not found error details."""
-        return {
-            "requested_value": requested_value
-        }
-    
-    @staticmethod
-    def build_filter_conflict_error(conflict: str, filters: Dict[str, Any]) -> Dict[str, Any]:
-        """Build filter conflict error details."""
-        return {
-            "conflict": conflict,
-            "filters": filters
-        }
\ No newline at end of file
+    build_validation_error = staticmethod(build_validation_error)
+    build_conflict_error = staticmethod(build_conflict_error)
+    build_not_found_error = staticmethod(build_not_found_error)
+    build_filter_conflict_error = staticmethod(build_filter_conflict_error)
@@ -14,6 +14,9 @@ class TestStringAnalyzer:
         assert StringAnalyzer.check_palindrome("hello") == False
         assert StringAnalyzer.check_palindrome("A") == True
         assert StringAnalyzer.check_palindrome("") == True
+        assert StringAnalyzer.check_palindrome("ab" * 200 + "a") == True
+        assert StringAnalyzer.check_palindrome("ab" * 200) == False
+        assert StringAnalyzer.check_palindrome("Ésé") == True
     
     def test_count_unique_chars(self):
         assert StringAnalyzer.count_unique_chars("hello") == 4  # h, e, l, o
@@ -27,6 +30,8 @@ class TestStringAnalyzer:
         assert StringAnalyzer.count_words("") == 0
         assert StringAnalyzer.count_words("one two three") == 3
         assert StringAnalyzer.count_words("  multiple   spaces  ") == 2
+        assert StringAnalyzer.count_words("one\ttwo\x0bthree " * 1000) == 3000
+        assert StringAnalyzer.count_words(" " * 5000) == 0
     
     def test_generate_sha256(self):
         hash1 = StringAnalyzer.generate_sha256("hello")
@@ -46,6 +51,9 @@ class TestStringAnalyzer:
         
         freq_map3 = StringAnalyzer.build_char_frequency_map("")
         assert freq_map3 == {}
+        
+        freq_map4 = StringAnalyzer.build_char_frequency_map("hello world " * 100)
+        assert list(freq_map4.items()) == [('h', 100), ('e', 100), ('l', 300), ('o', 200), (' ', 200), ('w', 100), ('r', 100), ('d', 100)]
     
     def test_analyze_complete(self):
         result = StringAnalyzer.analyze("racecar")
@@ -57,4 +65,4 @@ class TestStringAnalyzer:
         assert 'sha256_hash' in result
         assert result['character_frequency_map'] == {
             'r': 2, 'a': 2, 'c': 2, 'e': 1
-        }
\ No newline at end of file
+        }
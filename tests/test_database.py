@@ -0,0 +1,102 @@
+import pytest
+from app.database import InMemoryDatabase
+from app.models.string_model import StringModel
+from app.services.analyzer import StringAnalyzer
+from app.services.filters import FilterService
+
+VALUES = ["racecar", "hello world", "A man a plan", "noon", "zebra", "x", "level up", "Ésé", "abc def ghi"]
+
+def make_model(value: str) -> StringModel:
+    return StringModel(value=value, properties=StringAnalyzer.analyze(value))
+
+def assert_indexes_consistent(database: InMemoryDatabase):
+    """Every index must hold exactly the stored values, with no empty buckets left behind."""
+    models = database.get_all()
+    assert set(database._by_hash) == {s.id for s in models}
+    assert set(database._order) == {s.value for s in models}
+
+    for flag in (True, False):
+        assert database._by_palindrome[flag] == {s.value for s in models if s.properties['is_palindrome'] == flag}
+
+    expected_length, expected_words, expected_chars = {}, {}, {}
+    for s in models:
+        expected_length.setdefault(s.properties['length'], set()).add(s.value)
+        expected_words.setdefault(s.properties['word_count'], set()).add(s.value)
+        for char in s.properties['character_frequency_map']:
+            expected_chars.setdefault(char, set()).add(s.value)
+    assert dict(database._by_length) == expected_length
+    assert dict(database._by_word_count) == expected_words
+    assert dict(database._by_char) == expected_chars
+
+@pytest.fixture
+def database():
+    database = InMemoryDatabase()
+    for value in VALUES:
+        database.create(make_model(value))
+    return database
+
+class TestInMemoryDatabase:
+
+    def test_create_indexes_every_property(self, database):
+        assert database.count() == len(VALUES)
+        assert_indexes_consistent(database)
+        assert database.get_by_hash(make_model("noon").id).value == "noon"
+
+    def test_delete_removes_index_entries(self, database):
+        assert database.delete("zebra") == True
+        assert database.delete("zebra") == False
+        assert_indexes_consistent(database)
+        # "z" and "b" only occurred in "zebra", so their buckets are dropped
+        assert "z" not in database._by_char
+        assert "b" in database._by_char  # still present in "abc def ghi"
+
+        database.delete("x")
+        assert 1 not in database._by_length
+        assert_indexes_consistent(database)
+
+    def test_clear_empties_every_index(self, database):
+        database.clear()
+        assert database.count() == 0
+        assert_indexes_consistent(database)
+        assert database._by_palindrome == {True: set(), False: set()}
+
+    def test_get_many_keeps_insertion_order(self, database):
+        assert [s.value for s in database.get_many(set(VALUES))] == VALUES
+        assert [s.value for s in database.get_many(["noon", "missing", "racecar"])] == ["racecar", "noon"]
+
+class TestIndexedFilters:
+
+    @pytest.mark.parametrize("filters", [
+        {},
+        {'is_palindrome': True},
+        {'is_palindrome': False},
+        {'min_length': 4},
+        {'max_length': 5},
+        {'min_length': 4, 'max_length': 10},
+        {'word_count': 1},
+        {'word_count': 3, 'contains_character': 'a'},
+        {'contains_character': 'é'},
+        {'contains_character': 'q'},
+        {'is_palindrome': True, 'min_length': 4, 'word_count': 1, 'contains_character': 'o'},
+    ])
+    def test_matches_full_scan(self, database, filters):
+        indexed = FilterService.apply_indexed_filters(database, filters)
+        scanned = FilterService.apply_filters(database.get_all(), filters)
+        assert [s.value for s in indexed] == [s.value for s in scanned]
+
+    def test_order_after_delete_and_recreate(self, database):
+        database.delete("racecar")
+        database.create(make_model("racecar"))
+        assert_indexes_consistent(database)
+
+        filters = {'is_palindrome': True}
+        indexed = FilterService.apply_indexed_filters(database, filters)
+        scanned = FilterService.apply_filters(database.get_all(), filters)
+        assert [s.value for s in indexed] == [s.value for s in scanned]
+        assert indexed[-1].value == "racecar"
+
+    def test_full_scan_matches_substrings(self, database):
+        # apply_filters keeps its substring semantics for values that are not one character
+        scanned = FilterService.apply_filters(database.get_all(), {'contains_character': 'lo'})
+        assert [s.value for s in scanned] == ["hello world"]
+        assert FilterService.apply_filters(database.get_all(), {'contains_character': ''}) == database.get_all()
@@ -8,15 +8,15 @@ client = TestClient(app)
 @pytest.fixture(autouse=True)
 def clear_database():
     """Clear database before each test"""
-    db._store.clear()
+    db.clear()
     yield
-    db._store.clear()
+    db.clear()
 
 class TestCreateString:
     
     def test_create_string_success(self):
         response = client.post(
-            "/strings",
+            "/api/v1/strings",
             json={"value": "hello world"}
         )
         
@@ -29,17 +29,17 @@ class TestCreateString:
     
     def test_create_duplicate_string(self):
         # Create first time
-        client.post("/strings", json={"value": "test"})
+        client.post("/api/v1/strings", json={"value": "test"})
         
         # Try to create again
-        response = client.post("/strings", json={"value": "test"})
+        response = client.post("/api/v1/strings", json={"value": "test"})
         
         assert response.status_code == 409
         data = response.json()
         assert data['error'] == "CONFLICT"
     
     def test_create_palindrome(self):
-        response = client.post("/strings", json={"value": "racecar"})
+        response = client.post("/api/v1/strings", json={"value": "racecar"})
         
         assert response.status_code == 201
         data = response.json()
@@ -49,17 +49,17 @@ class TestGetString:
     
     def test_get_existing_string(self):
         # Create string first
-        client.post("/strings", json={"value": "test string"})
+        client.post("/api/v1/strings", json={"value": "test string"})
         
         # Get it
-        response = client.get("/strings/test%20string")
+        response = client.get("/api/v1/strings/test%20string")
         
         assert response.status_code == 200
         data = response.json()
         assert data['value'] == "test string"
     
     def test_get_nonexistent_string(self):
-        response = client.get("/strings/nonexistent")
+        response = client.get("/api/v1/strings/nonexistent")
         
         assert response.status_code == 404
         data = response.json()
@@ -69,10 +69,10 @@ class TestGetAllStrings:
     
     def test_get_all_no_filters(self):
         # Create some strings
-        client.post("/strings", json={"value": "hello"})
-        client.post("/strings", json={"value": "world"})
+        client.post("/api/v1/strings", json={"value": "hello"})
+        client.post("/api/v1/strings", json={"value": "world"})
         
-        response = client.get("/strings")
+        response = client.get("/api/v1/strings")
         
         assert response.status_code == 200
         data = response.json()
@@ -80,11 +80,11 @@ class TestGetAllStrings:
         assert len(data['data']) == 2
     
     def test_filter_by_palindrome(self):
-        client.post("/strings", json={"value": "racecar"})
-        client.post("/strings", json={"value": "hello"})
-        client.post("/strings", json={"value": "level"})
+        client.post("/api/v1/strings", json={"value": "racecar"})
+        client.post("/api/v1/strings", json={"value": "hello"})
+        client.post("/api/v1/strings", json={"value": "level"})
         
-        response = client.get("/strings?is_palindrome=true")
+        response = client.get("/api/v1/strings?is_palindrome=true")
         
         assert response.status_code == 200
         data = response.json()
@@ -92,24 +92,45 @@ class TestGetAllStrings:
         assert data['filters_applied']['is_palindrome'] == True
     
     def test_filter_by_length(self):
-        client.post("/strings", json={"value": "hi"})
-        client.post("/strings", json={"value": "hello"})
-        client.post("/strings", json={"value": "world"})
+        client.post("/api/v1/strings", json={"value": "hi"})
+        client.post("/api/v1/strings", json={"value": "hello"})
+        client.post("/api/v1/strings", json={"value": "world"})
         
-        response = client.get("/strings?min_length=5")
+        response = client.get("/api/v1/strings?min_length=5")
         
         assert response.status_code == 200
         data = response.json()
         assert data['count'] == 2
+    
+    def test_filter_with_oversized_integers(self):
+        client.post("/api/v1/strings", json={"value": "hello"})
+        
+        # Wider than 64 bits, which orjson cannot encode when echoing filters_applied
+        response = client.get("/api/v1/strings?min_length=99999999999999999999")
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data['count'] == 0
+        assert data['filters_applied']['min_length'] == 99999999999999999999
+        
+        response = client.get("/api/v1/strings?word_count=99999999999999999999")
+        
+        assert response.status_code == 200
+        assert response.json()['count'] == 0
+        
+        response = client.get("/api/v1/strings?min_length=99999999999999999999&max_length=5")
+        
+        assert response.status_code == 400
+        assert response.json()['timestamp'].endswith('Z')
 
 class TestNaturalLanguage:
     
     def test_nl_single_word_palindrome(self):
-        client.post("/strings", json={"value": "racecar"})
-        client.post("/strings", json={"value": "hello world"})
+        client.post("/api/v1/strings", json={"value": "racecar"})
+        client.post("/api/v1/strings", json={"value": "hello world"})
         
         response = client.get(
-            "/strings/filter-by-natural-language?query=single%20word%20palindromic%20strings"
+            "/api/v1/strings/filter-by-natural-language?query=single%20word%20palindromic%20strings"
         )
         
         assert response.status_code == 200
@@ -117,18 +138,47 @@ class TestNaturalLanguage:
         assert data['count'] == 1
         assert data['interpreted_query']['parsed_filters']['word_count'] == 1
         assert data['interpreted_query']['parsed_filters']['is_palindrome'] == True
+    
+    def test_nl_open_length_bound_is_not_a_conflict(self):
+        client.post("/api/v1/strings", json={"value": "hello"})
+        
+        response = client.get(
+            "/api/v1/strings/filter-by-natural-language?query=strings%20shorter%20than%200%20characters"
+        )
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data['count'] == 0
+        assert data['interpreted_query']['parsed_filters'] == {'max_length': -1}
+    
+    def test_nl_oversized_numbers_are_unparseable(self):
+        for query in (
+            "strings%20longer%20than%2099999999999999999999%20characters",
+            "strings%20with%2099999999999999999999%20words",
+            "palindromes%20longer%20than%209223372036854775807%20characters",
+        ):
+            response = client.get(f"/api/v1/strings/filter-by-natural-language?query={query}")
+            
+            assert response.status_code == 400
+        
+        response = client.get(
+            "/api/v1/strings/filter-by-natural-language?query=strings%20containing%20the%20letter%20z%20longer%20than%205%20characters"
+        )
+        
+        assert response.status_code == 200
+        assert response.json()['interpreted_query']['parsed_filters'] == {'min_length': 6, 'contains_character': 'z'}
 
 class TestDeleteString:
     
     def test_delete_existing_string(self):
-        client.post("/strings", json={"value": "delete me"})
+        client.post("/api/v1/strings", json={"value": "delete me"})
         
-        response = client.delete("/strings/delete%20me")
+        response = client.delete("/api/v1/strings/delete%20me")
         
         assert response.status_code == 204
     
     def test_delete_nonexistent_string(self):
-        response = client.delete("/strings/nonexistent")
+        response = client.delete("/api/v1/strings/nonexistent")
         
         assert response.status_code == 404
         data = response.json()
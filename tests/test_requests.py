@@ -0,0 +1,63 @@
+import asyncio
+import pytest
+from fastapi import HTTPException, Request
+from fastapi.exceptions import RequestValidationError
+from fastapi.testclient import TestClient
+from app.main import app
+from app.schemas.requests import parse_create_string_request
+
+client = TestClient(app)
+
+def parse(body: bytes, content_type: str = "application/json"):
+    async def receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+    headers = [(b"content-type", content_type.encode())] if content_type is not None else []
+    request = Request({"type": "http", "method": "POST", "headers": headers}, receive)
+    return asyncio.run(parse_create_string_request(request))
+
+def errors_for(body: bytes, content_type: str = "application/json"):
+    with pytest.raises(RequestValidationError) as exc_info:
+        parse(body, content_type)
+    return [(error["type"], tuple(error["loc"])) for error in exc_info.value.errors()]
+
+class TestParseCreateStringRequest:
+
+    def test_valid_body(self):
+        assert parse(b'{"value": "hello world"}').value == "hello world"
+        assert parse(b'{"value": "a\\ud83d\\ude00b", "extra": 1}').value == "a\U0001F600b"
+
+    def test_json_content_types(self):
+        assert parse(b'{"value": "x"}', "application/json; charset=utf-8").value == "x"
+        assert parse(b'{"value": "x"}', "application/merge-patch+json").value == "x"
+        assert parse(b'{"value": "x"}', None).value == "x"
+
+    def test_non_json_content_type(self):
+        assert errors_for(b'{"value": "x"}', "text/plain") == [("model_type", ("body",))]
+
+    def test_missing_field(self):
+        assert errors_for(b'{}') == [("missing", ("body", "value"))]
+
+    def test_wrong_type(self):
+        assert errors_for(b'{"value": 123}') == [("string_type", ("body", "value"))]
+        assert errors_for(b'{"value": null}') == [("string_type", ("body", "value"))]
+        assert errors_for(b'[1]') == [("model_type", ("body",))]
+
+    def test_invalid_json(self):
+        assert errors_for(b'{bad') == [("json_invalid", ("body",))]
+        assert errors_for(b'') == [("json_invalid", ("body",))]
+        assert errors_for(b'{"value": "a\\ud800b"}') == [("json_invalid", ("body",))]
+
+    def test_invalid_utf8(self):
+        with pytest.raises(HTTPException) as exc_info:
+            parse(b'{"value":"\xff"}')
+        assert exc_info.value.status_code == 400
+
+    def test_invalid_utf8_response(self):
+        response = client.post(
+            "/api/v1/strings",
+            content=b'{"value":"\xff"}',
+            headers={"content-type": "application/json"}
+        )
+
+        assert response.status_code == 400
+        assert response.json() == {"detail": "There was an error parsing the body"}
@@ -0,0 +1,19 @@
+import pytest
+from urllib.parse import quote
+from app.utils.validators import RequestValidator
+
+class TestSanitizeStringForUrl:
+
+    @pytest.mark.parametrize("value", [
+        "",
+        "hello",
+        "AZaz09-._~",
+        "hello world",
+        "a/b?c=d&e#f",
+        "100% sure: yes!",
+        "naïve café",
+        "日本語",
+        "emoji 😀",
+    ])
+    def test_matches_urllib_quote(self, value):
+        assert RequestValidator.sanitize_string_for_url(value) == quote(value, safe='')